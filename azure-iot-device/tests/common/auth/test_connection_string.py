@@ -5,12 +5,9 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import six
 from azure.iot.device.common.auth.connection_string import ConnectionString
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 @pytest.mark.describe("ConnectionString")
 class TestConnectionString(object):
@@ -8,12 +8,9 @@
 import pytest
 import time
 import re
-import logging
 import six.moves.urllib as urllib
 from azure.iot.device.common.auth.sastoken import SasToken, SasTokenError
 
-logging.basicConfig(level=logging.DEBUG)
-
 fake_uri = "some/resource/location"
 fake_signed_data = "ajsc8nLKacIjGsYyB4iYDFCZaRMmmDrUuY5lncYDYPI="
 fake_key_name = "fakekeyname"
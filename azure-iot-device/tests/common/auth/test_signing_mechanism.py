@@ -5,14 +5,11 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import hmac
 import hashlib
 import base64
 from azure.iot.device.common.auth import SymmetricKeySigningMechanism
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 @pytest.mark.describe("SymmetricKeySigningMechanism - Instantiation")
 class TestSymmetricKeySigningMechanismInstantiation(object):
@@ -5,11 +5,8 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from azure.iot.device.common.models import ProxyOptions
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 @pytest.mark.describe("ProxyOptions")
 class TestProxyOptions(object):
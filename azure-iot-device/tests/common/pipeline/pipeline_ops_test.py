@@ -4,15 +4,12 @@
 # license information.
 # --------------------------------------------------------------------------
 import pytest
-import logging
 import threading
 
 from azure.iot.device.common.pipeline.pipeline_ops_base import PipelineOperation
 from azure.iot.device.common import handle_exceptions
 from azure.iot.device.common.pipeline import pipeline_exceptions
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 def add_operation_tests(
     test_module,
@@ -3,15 +3,12 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 from tests.common.pipeline.helpers import StageRunOpTestBase, StageHandlePipelineEventTestBase
 from azure.iot.device.common.pipeline.pipeline_stages_base import PipelineStage, PipelineRootStage
 from azure.iot.device.common.pipeline import pipeline_exceptions
 from azure.iot.device.common import handle_exceptions
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 def add_base_pipeline_stage_tests(
     test_module,
@@ -5,11 +5,9 @@
 # --------------------------------------------------------------------------
 import sys
 import pytest
-import logging
 from azure.iot.device.common.pipeline import pipeline_events_base
 from tests.common.pipeline import pipeline_event_test
 
-logging.basicConfig(level=logging.DEBUG)
 this_module = sys.modules[__name__]
 
 
@@ -5,12 +5,10 @@
 # --------------------------------------------------------------------------
 import sys
 import pytest
-import logging
 from azure.iot.device.common.pipeline import pipeline_ops_base
 from tests.common.pipeline import pipeline_ops_test
 
 this_module = sys.modules[__name__]
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 
@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import copy
 import time
 import pytest
@@ -26,7 +25,6 @@ from .fixtures import ArbitraryOperation
 from tests.common.pipeline import pipeline_stage_test
 
 this_module = sys.modules[__name__]
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 
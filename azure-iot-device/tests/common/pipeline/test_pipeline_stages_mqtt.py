@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 import sys
 import six
@@ -23,7 +22,6 @@ from tests.common.pipeline.helpers import StageRunOpTestBase
 from tests.common.pipeline import pipeline_stage_test
 
 this_module = sys.modules[__name__]
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 ###################
@@ -310,12 +308,11 @@ class TestMQTTTransportStageRunOpCalledWithConnectOperation(
         "Performs an MQTT connect via the MQTTTransport, using the root's SasToken as a password, if using SAS-based authentication"
     )
     def test_mqtt_connect_sastoken(self, mocker, stage, op):
-        assert stage.pipeline_root.pipeline_configuration.sastoken is not None
+        sastoken = stage.pipeline_root.pipeline_configuration.sastoken
+        assert sastoken is not None
         stage.run_op(op)
         assert stage.transport.connect.call_count == 1
-        assert stage.transport.connect.call_args == mocker.call(
-            password=str(stage.pipeline_root.pipeline_configuration.sastoken)
-        )
+        assert stage.transport.connect.call_args == mocker.call(password=str(sastoken))
 
     @pytest.mark.it(
         "Performs an MQTT connect via the MQTTTransport, with no password, if NOT using SAS-based authentication"
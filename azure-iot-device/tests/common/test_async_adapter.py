@@ -7,10 +7,8 @@
 import pytest
 import inspect
 import asyncio
-import logging
 import azure.iot.device.common.async_adapter as async_adapter
 
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.asyncio
 
 
@@ -7,11 +7,8 @@
 import pytest
 import asyncio
 import sys
-import logging
 from azure.iot.device.common import asyncio_compat
 
-logging.basicConfig(level=logging.DEBUG)
-
 pytestmark = pytest.mark.asyncio
 
 
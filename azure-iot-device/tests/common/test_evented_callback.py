@@ -5,12 +5,9 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from time import sleep
 from azure.iot.device.common.evented_callback import EventedCallback
 
-logging.basicConfig(level=logging.INFO)
-
 
 @pytest.mark.describe("EventedCallback")
 class TestEventedCallback(object):
@@ -10,13 +10,9 @@ from azure.iot.device.common.models.x509 import X509
 from six.moves import http_client
 from azure.iot.device.common import transport_exceptions as errors
 import pytest
-import logging
 import ssl
 import threading
 
-
-logging.basicConfig(level=logging.DEBUG)
-
 fake_hostname = "__fake_hostname__"
 fake_method = "__fake_method__"
 fake_path = "__fake_path__"
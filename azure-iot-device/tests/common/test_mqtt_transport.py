@@ -12,7 +12,6 @@ import paho.mqtt.client as mqtt
 import ssl
 import copy
 import pytest
-import logging
 import socket
 import socks
 import threading
@@ -20,8 +19,6 @@ import gc
 import weakref
 import azure.iot.device.common.pipeline.config as pipeline_config
 
-logging.basicConfig(level=logging.DEBUG)
-
 fake_hostname = "beauxbatons.academy-net"
 fake_device_id = "MyFirebolt"
 fake_password = "Fortuna Major"
@@ -67,6 +64,9 @@ connack_return_codes = [
         "error": errors.UnauthorizedError,
     },
 ]
+connack_return_code_ids = [
+    "{}->{}".format(x["name"], x["error"].__name__) for x in connack_return_codes
+]
 
 
 # mapping of Paho rc codes to Error object classes
@@ -123,15 +123,24 @@ operation_return_codes = [
         "error": errors.ProtocolClientError,
     },
 ]
+operation_return_code_ids = [
+    "{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes
+]
+
+
+def assert_call_counts(callbacks, expected_call_counts):
+    assert [callback.call_count for callback in callbacks] == expected_call_counts
 
 
 @pytest.fixture
 def mock_mqtt_client(mocker, fake_paho_thread):
-    mock = mocker.patch.object(mqtt, "Client")
+    # spec (rather than autospec) restricts the mocked client to the real Paho API without
+    # the cost of introspecting the Client class on every test
+    mock = mocker.patch.object(mqtt, "Client", spec=mqtt.Client)
     mock_mqtt_client = mock.return_value
-    mock_mqtt_client.subscribe = mocker.MagicMock(return_value=(fake_rc, fake_mid))
-    mock_mqtt_client.unsubscribe = mocker.MagicMock(return_value=(fake_rc, fake_mid))
-    mock_mqtt_client.publish = mocker.MagicMock(return_value=(fake_rc, fake_mid))
+    mock_mqtt_client.subscribe.return_value = (fake_rc, fake_mid)
+    mock_mqtt_client.unsubscribe.return_value = (fake_rc, fake_mid)
+    mock_mqtt_client.publish.return_value = (fake_rc, fake_mid)
     mock_mqtt_client.connect.return_value = 0
     mock_mqtt_client.reconnect.return_value = 0
     mock_mqtt_client.disconnect.return_value = 0
@@ -145,11 +154,10 @@ def transport(mock_mqtt_client):
     return MQTTTransport(client_id=fake_device_id, hostname=fake_hostname, username=fake_username)
 
 
-@pytest.fixture
-def fake_paho_thread(mocker):
-    thread = mocker.MagicMock(spec=threading.Thread)
-    thread.name = "_fake_paho_thread_"
-    return thread
+# The fake threads are never started or modified, so a single instance of each can be shared
+@pytest.fixture(scope="session")
+def fake_paho_thread():
+    return threading.Thread(name="_fake_paho_thread_")
 
 
 @pytest.fixture
@@ -157,11 +165,9 @@ def mock_paho_thread_current(mocker, fake_paho_thread):
     return mocker.patch.object(threading, "current_thread", return_value=fake_paho_thread)
 
 
-@pytest.fixture
-def fake_non_paho_thread(mocker):
-    thread = mocker.MagicMock(spec=threading.Thread)
-    thread.name = "_fake_non_paho_thread_"
-    return thread
+@pytest.fixture(scope="session")
+def fake_non_paho_thread():
+    return threading.Thread(name="_fake_non_paho_thread_")
 
 
 @pytest.fixture
@@ -326,19 +332,15 @@ class TestInstantiation(object):
         assert transport.on_mqtt_message_received_handler is None
 
     @pytest.mark.it("Initializes internal operation tracking structures")
-    def test_operation_infrastructure_set_up(self, mocker):
-        transport = MQTTTransport(
-            client_id=fake_device_id, hostname=fake_hostname, username=fake_username
-        )
+    def test_operation_infrastructure_set_up(self, transport):
         assert transport._op_manager._pending_operation_callbacks == {}
         assert transport._op_manager._unknown_operation_completions == {}
 
     @pytest.mark.it("Sets paho auto-reconnect interval to 2 hours")
-    def test_sets_reconnect_interval(self, mocker, transport, mock_mqtt_client):
+    def test_sets_reconnect_interval(self, mocker, mock_mqtt_client):
         MQTTTransport(client_id=fake_device_id, hostname=fake_hostname, username=fake_username)
 
-        # called once by the mqtt_client constructor and once by mqtt_transport.py
-        assert mock_mqtt_client.reconnect_delay_set.call_count == 2
+        assert mock_mqtt_client.reconnect_delay_set.call_count == 1
         assert mock_mqtt_client.reconnect_delay_set.call_args == mocker.call(120 * 60)
 
 
@@ -348,24 +350,24 @@ class ArbitraryConnectException(Exception):
 
 @pytest.mark.describe("MQTTTransport - .connect()")
 class TestConnect(object):
-    @pytest.mark.it("Uses the stored username and provided password for Paho credentials")
-    def test_use_provided_password(self, mocker, mock_mqtt_client, transport):
-        transport.connect(fake_password)
-
-        assert mock_mqtt_client.username_pw_set.call_count == 1
-        assert mock_mqtt_client.username_pw_set.call_args == mocker.call(
-            username=transport._username, password=fake_password
-        )
-
     @pytest.mark.it(
-        "Uses the stored username without a password for Paho credentials, if password is not provided"
+        "Uses the stored username and provided password for Paho credentials, or no password if password is not provided"
     )
-    def test_use_no_password(self, mocker, mock_mqtt_client, transport):
-        transport.connect()
+    @pytest.mark.parametrize(
+        "connect_kwargs, expected_password",
+        [
+            pytest.param({"password": fake_password}, fake_password, id="Password provided"),
+            pytest.param({}, None, id="No password provided"),
+        ],
+    )
+    def test_uses_password(
+        self, mocker, mock_mqtt_client, transport, connect_kwargs, expected_password
+    ):
+        transport.connect(**connect_kwargs)
 
         assert mock_mqtt_client.username_pw_set.call_count == 1
         assert mock_mqtt_client.username_pw_set.call_args == mocker.call(
-            username=transport._username, password=None
+            username=transport._username, password=expected_password
         )
 
     @pytest.mark.it("Initiates MQTT connect via Paho")
@@ -496,7 +498,7 @@ class TestConnect(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     def test_client_returns_failing_rc_code(
         self, mocker, mock_mqtt_client, transport, error_params
@@ -573,7 +575,7 @@ class TestEventConnectComplete(object):
         "Triggers on_mqtt_connected_handler event handler upon successful connect completion"
     )
     def test_calls_event_handler_callback(self, mocker, mock_mqtt_client, transport):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         transport.on_mqtt_connected_handler = callback
 
         # Manually trigger Paho on_connect event_handler
@@ -600,7 +602,7 @@ class TestEventConnectComplete(object):
     def test_event_handler_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_exception)
         transport.on_mqtt_connected_handler = event_cb
 
         transport.connect(fake_password)
@@ -615,7 +617,7 @@ class TestEventConnectComplete(object):
     def test_event_handler_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_base_exception)
         transport.on_mqtt_connected_handler = event_cb
 
         transport.connect(fake_password)
@@ -631,7 +633,7 @@ class TestEventConnectionFailure(object):
     @pytest.mark.parametrize(
         "error_params",
         connack_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in connack_return_codes],
+        ids=connack_return_code_ids,
     )
     @pytest.mark.it(
         "Triggers on_mqtt_connection_failure_handler event handler with custom Exception upon failed connect completion"
@@ -639,7 +641,7 @@ class TestEventConnectionFailure(object):
     def test_calls_event_handler_callback_with_failed_rc(
         self, mocker, mock_mqtt_client, transport, error_params
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         transport.on_mqtt_connection_failure_handler = callback
 
         # Initiate connect
@@ -673,7 +675,7 @@ class TestEventConnectionFailure(object):
     def test_event_handler_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_exception)
         transport.on_mqtt_connection_failure_handler = event_cb
 
         transport.connect(fake_password)
@@ -690,7 +692,7 @@ class TestEventConnectionFailure(object):
     def test_event_handler_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_base_exception)
         transport.on_mqtt_connection_failure_handler = event_cb
 
         transport.connect(fake_password)
@@ -734,7 +736,7 @@ class TestDisconnect(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     def test_client_returns_failing_rc_code(
         self, mocker, mock_mqtt_client, transport, error_params
@@ -831,7 +833,7 @@ class TestEventDisconnectCompleted(object):
     def test_calls_event_handler_callback_externally_driven(
         self, mocker, mock_mqtt_client, transport
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         transport.on_mqtt_disconnected_handler = callback
 
         # Initiate disconnect
@@ -847,7 +849,7 @@ class TestEventDisconnectCompleted(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     @pytest.mark.it(
         "Triggers on_mqtt_disconnected_handler event handler with custom Exception when an error RC is returned upon disconnect competion."
@@ -855,7 +857,7 @@ class TestEventDisconnectCompleted(object):
     def test_calls_event_handler_callback_with_failure_user_driven(
         self, mocker, mock_mqtt_client, transport, error_params
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         transport.on_mqtt_disconnected_handler = callback
 
         # Initiate disconnect
@@ -887,7 +889,7 @@ class TestEventDisconnectCompleted(object):
     def test_event_handler_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_exception)
         transport.on_mqtt_disconnected_handler = event_cb
 
         transport.disconnect()
@@ -902,7 +904,7 @@ class TestEventDisconnectCompleted(object):
     def test_event_handler_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_base_exception)
         transport.on_mqtt_disconnected_handler = event_cb
 
         transport.disconnect()
@@ -911,30 +913,35 @@ class TestEventDisconnectCompleted(object):
         assert e_info.value is arbitrary_base_exception
 
     @pytest.mark.it("Calls Paho's disconnect() method if cause is not None")
-    def test_calls_disconnect_with_cause(self, mock_mqtt_client, transport):
+    @pytest.mark.usefixtures("transport")
+    def test_calls_disconnect_with_cause(self, mock_mqtt_client):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_failed_rc)
         assert mock_mqtt_client.disconnect.call_count == 1
 
     @pytest.mark.it("Does not call Paho's disconnect() method if cause is None")
-    def test_doesnt_call_disconnect_without_cause(self, mock_mqtt_client, transport):
+    @pytest.mark.usefixtures("transport")
+    def test_doesnt_call_disconnect_without_cause(self, mock_mqtt_client):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_success_rc)
         assert mock_mqtt_client.disconnect.call_count == 0
 
     @pytest.mark.it("Calls Paho's loop_stop() if cause is not None")
-    def test_calls_loop_stop(self, mock_mqtt_client, transport):
+    @pytest.mark.usefixtures("transport")
+    def test_calls_loop_stop(self, mock_mqtt_client):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_failed_rc)
         assert mock_mqtt_client.loop_stop.call_count == 1
 
     @pytest.mark.it("Does not calls Paho's loop_stop() if cause is None")
-    def test_does_not_call_loop_stop(self, mock_mqtt_client, transport):
+    @pytest.mark.usefixtures("transport")
+    def test_does_not_call_loop_stop(self, mock_mqtt_client):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_success_rc)
         assert mock_mqtt_client.loop_stop.call_count == 0
 
     @pytest.mark.it(
         "Sets Paho's _thread to None if cause is not None while running in the Paho thread"
     )
+    @pytest.mark.usefixtures("transport")
     def test_sets_thread_to_none_on_failure_in_paho_thread(
-        self, mock_mqtt_client, transport, mock_paho_thread_current
+        self, mock_mqtt_client, mock_paho_thread_current
     ):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_failed_rc)
         assert mock_mqtt_client._thread is None
@@ -942,8 +949,9 @@ class TestEventDisconnectCompleted(object):
     @pytest.mark.it(
         "Does not set Paho's _thread to None if cause is not None while running outside the paho thread"
     )
+    @pytest.mark.usefixtures("transport")
     def test_sets_thread_to_none_on_failure_in_non_paho_thread(
-        self, mock_mqtt_client, transport, mock_non_paho_thread_current
+        self, mock_mqtt_client, mock_non_paho_thread_current
     ):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_failed_rc)
         assert mock_mqtt_client._thread is not None
@@ -951,8 +959,9 @@ class TestEventDisconnectCompleted(object):
     @pytest.mark.it(
         "Does not sets Paho's _thread to None if cause is None while running in the Paho thread"
     )
+    @pytest.mark.usefixtures("transport")
     def test_does_not_set_thread_to_none_on_success_in_paho_thread(
-        self, mock_mqtt_client, transport, mock_paho_thread_current
+        self, mock_mqtt_client, mock_paho_thread_current
     ):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_success_rc)
         assert mock_mqtt_client._thread is not None
@@ -960,17 +969,17 @@ class TestEventDisconnectCompleted(object):
     @pytest.mark.it(
         "Does not sets Paho's _thread to None if cause is None while running outside the Paho thread"
     )
+    @pytest.mark.usefixtures("transport")
     def test_does_not_set_thread_to_none_on_success_in_non_paho_thread(
-        self, mock_mqtt_client, transport, mock_non_paho_thread_current
+        self, mock_mqtt_client, mock_non_paho_thread_current
     ):
         mock_mqtt_client.on_disconnect(client=mock_mqtt_client, userdata=None, rc=fake_success_rc)
         assert mock_mqtt_client._thread is not None
 
     @pytest.mark.it("Allows any Exception raised by Paho's disconnect() to propagate")
-    def test_disconnect_raises_exception(
-        self, mock_mqtt_client, transport, mocker, arbitrary_exception
-    ):
-        mock_mqtt_client.disconnect = mocker.MagicMock(side_effect=arbitrary_exception)
+    @pytest.mark.usefixtures("transport")
+    def test_disconnect_raises_exception(self, mock_mqtt_client, arbitrary_exception):
+        mock_mqtt_client.disconnect.side_effect = arbitrary_exception
         with pytest.raises(type(arbitrary_exception)) as e_info:
             mock_mqtt_client.on_disconnect(
                 client=mock_mqtt_client, userdata=None, rc=fake_failed_rc
@@ -978,10 +987,9 @@ class TestEventDisconnectCompleted(object):
         assert e_info.value is arbitrary_exception
 
     @pytest.mark.it("Allows any BaseException raised by Paho's disconnect() to propagate")
-    def test_disconnect_raises_base_exception(
-        self, mock_mqtt_client, transport, mocker, arbitrary_base_exception
-    ):
-        mock_mqtt_client.disconnect = mocker.MagicMock(side_effect=arbitrary_base_exception)
+    @pytest.mark.usefixtures("transport")
+    def test_disconnect_raises_base_exception(self, mock_mqtt_client, arbitrary_base_exception):
+        mock_mqtt_client.disconnect.side_effect = arbitrary_base_exception
         with pytest.raises(type(arbitrary_base_exception)) as e_info:
             mock_mqtt_client.on_disconnect(
                 client=mock_mqtt_client, userdata=None, rc=fake_failed_rc
@@ -989,10 +997,9 @@ class TestEventDisconnectCompleted(object):
         assert e_info.value is arbitrary_base_exception
 
     @pytest.mark.it("Allows any Exception raised by Paho's loop_stop() to propagate")
-    def test_loop_stop_raises_exception(
-        self, mock_mqtt_client, transport, mocker, arbitrary_exception
-    ):
-        mock_mqtt_client.loop_stop = mocker.MagicMock(side_effect=arbitrary_exception)
+    @pytest.mark.usefixtures("transport")
+    def test_loop_stop_raises_exception(self, mock_mqtt_client, arbitrary_exception):
+        mock_mqtt_client.loop_stop.side_effect = arbitrary_exception
         with pytest.raises(type(arbitrary_exception)) as e_info:
             mock_mqtt_client.on_disconnect(
                 client=mock_mqtt_client, userdata=None, rc=fake_failed_rc
@@ -1000,10 +1007,9 @@ class TestEventDisconnectCompleted(object):
         assert e_info.value is arbitrary_exception
 
     @pytest.mark.it("Allows any BaseException raised by Paho's loop_stop() to propagate")
-    def test_loop_stop_raises_base_exception(
-        self, mock_mqtt_client, transport, mocker, arbitrary_base_exception
-    ):
-        mock_mqtt_client.loop_stop = mocker.MagicMock(side_effect=arbitrary_base_exception)
+    @pytest.mark.usefixtures("transport")
+    def test_loop_stop_raises_base_exception(self, mock_mqtt_client, arbitrary_base_exception):
+        mock_mqtt_client.loop_stop.side_effect = arbitrary_base_exception
         with pytest.raises(type(arbitrary_base_exception)) as e_info:
             mock_mqtt_client.on_disconnect(
                 client=mock_mqtt_client, userdata=None, rc=fake_failed_rc
@@ -1097,7 +1103,7 @@ class TestSubscribe(object):
     def test_triggers_callback_upon_paho_on_subscribe_event(
         self, mocker, mock_mqtt_client, transport
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         mock_mqtt_client.subscribe.return_value = (fake_rc, fake_mid)
 
         # Initiate subscribe
@@ -1120,7 +1126,7 @@ class TestSubscribe(object):
     def test_triggers_callback_when_paho_on_subscribe_event_called_early(
         self, mocker, mock_mqtt_client, transport
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
 
         def trigger_early_on_subscribe(topic, qos):
 
@@ -1185,9 +1191,9 @@ class TestSubscribe(object):
         "Handles multiple callbacks from multiple subscribe operations that complete out of order"
     )
     def test_multiple_callbacks(self, mocker, mock_mqtt_client, transport):
-        callback1 = mocker.MagicMock()
-        callback2 = mocker.MagicMock()
-        callback3 = mocker.MagicMock()
+        callback1 = mocker.Mock()
+        callback2 = mocker.Mock()
+        callback3 = mocker.Mock()
 
         mid1 = 1
         mid2 = 2
@@ -1201,37 +1207,29 @@ class TestSubscribe(object):
         transport.subscribe(topic=fake_topic, qos=fake_qos, callback=callback3)
 
         # Check callbacks have not yet been called
-        assert callback1.call_count == 0
-        assert callback2.call_count == 0
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 0, 0])
 
         # Manually trigger Paho on_subscribe event handler (2 -> 3 -> 1)
         mock_mqtt_client.on_subscribe(
             client=mock_mqtt_client, userdata=None, mid=mid2, granted_qos=fake_qos
         )
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 0])
 
         mock_mqtt_client.on_subscribe(
             client=mock_mqtt_client, userdata=None, mid=mid3, granted_qos=fake_qos
         )
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 1])
 
         mock_mqtt_client.on_subscribe(
             client=mock_mqtt_client, userdata=None, mid=mid1, granted_qos=fake_qos
         )
-        assert callback1.call_count == 1
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [1, 1, 1])
 
     @pytest.mark.it("Recovers from Exception in callback")
     def test_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
         mock_mqtt_client.subscribe.return_value = (fake_rc, fake_mid)
 
         transport.subscribe(topic=fake_topic, qos=fake_qos, callback=callback)
@@ -1246,7 +1244,7 @@ class TestSubscribe(object):
     def test_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
         mock_mqtt_client.subscribe.return_value = (fake_rc, fake_mid)
 
         transport.subscribe(topic=fake_topic, qos=fake_qos, callback=callback)
@@ -1260,7 +1258,7 @@ class TestSubscribe(object):
     def test_callback_rasies_exception_when_paho_on_subscribe_triggered_early(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
 
         def trigger_early_on_subscribe(topic, qos):
             mock_mqtt_client.on_subscribe(
@@ -1286,7 +1284,7 @@ class TestSubscribe(object):
     def test_callback_raises_base_exception_when_paho_on_subscribe_triggered_early(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
 
         def trigger_early_on_subscribe(topic, qos):
             mock_mqtt_client.on_subscribe(
@@ -1329,7 +1327,7 @@ class TestSubscribe(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     def test_client_returns_failing_rc_code(
         self, mocker, mock_mqtt_client, transport, error_params
@@ -1362,7 +1360,7 @@ class TestUnsubscribe(object):
     def test_triggers_callback_upon_paho_on_unsubscribe_event(
         self, mocker, mock_mqtt_client, transport
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         mock_mqtt_client.unsubscribe.return_value = (fake_rc, fake_mid)
 
         # Initiate unsubscribe
@@ -1383,7 +1381,7 @@ class TestUnsubscribe(object):
     def test_triggers_callback_when_paho_on_unsubscribe_event_called_early(
         self, mocker, mock_mqtt_client, transport
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
 
         def trigger_early_on_unsubscribe(topic):
 
@@ -1444,9 +1442,9 @@ class TestUnsubscribe(object):
         "Handles multiple callbacks from multiple unsubscribe operations that complete out of order"
     )
     def test_multiple_callbacks(self, mocker, mock_mqtt_client, transport):
-        callback1 = mocker.MagicMock()
-        callback2 = mocker.MagicMock()
-        callback3 = mocker.MagicMock()
+        callback1 = mocker.Mock()
+        callback2 = mocker.Mock()
+        callback3 = mocker.Mock()
 
         mid1 = 1
         mid2 = 2
@@ -1464,31 +1462,23 @@ class TestUnsubscribe(object):
         transport.unsubscribe(topic=fake_topic, callback=callback3)
 
         # Check callbacks have not yet been called
-        assert callback1.call_count == 0
-        assert callback2.call_count == 0
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 0, 0])
 
         # Manually trigger Paho on_unsubscribe event handler (2 -> 3 -> 1)
         mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=mid2)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 0])
 
         mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=mid3)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 1])
 
         mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=mid1)
-        assert callback1.call_count == 1
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [1, 1, 1])
 
     @pytest.mark.it("Recovers from Exception in callback")
     def test_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
         mock_mqtt_client.unsubscribe.return_value = (fake_rc, fake_mid)
 
         transport.unsubscribe(topic=fake_topic, callback=callback)
@@ -1501,7 +1491,7 @@ class TestUnsubscribe(object):
     def test_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
         mock_mqtt_client.unsubscribe.return_value = (fake_rc, fake_mid)
 
         transport.unsubscribe(topic=fake_topic, callback=callback)
@@ -1513,7 +1503,7 @@ class TestUnsubscribe(object):
     def test_callback_rasies_exception_when_paho_on_unsubscribe_triggered_early(
         self, mocker, mock_mqtt_client, transport, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
 
         def trigger_early_on_unsubscribe(topic):
             mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=fake_mid)
@@ -1537,7 +1527,7 @@ class TestUnsubscribe(object):
     def test_callback_rasies_base_exception_when_paho_on_unsubscribe_triggered_early(
         self, mocker, mock_mqtt_client, transport, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
 
         def trigger_early_on_unsubscribe(topic):
             mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=fake_mid)
@@ -1580,7 +1570,7 @@ class TestUnsubscribe(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     def test_client_returns_failing_rc_code(
         self, mocker, mock_mqtt_client, transport, error_params
@@ -1669,7 +1659,7 @@ class TestPublish(object):
     def test_triggers_callback_upon_paho_on_publish_event(
         self, mocker, mock_mqtt_client, transport, message_info
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         mock_mqtt_client.publish.return_value = message_info
 
         # Initiate publish
@@ -1690,7 +1680,7 @@ class TestPublish(object):
     def test_triggers_callback_when_paho_on_publish_event_called_early(
         self, mocker, mock_mqtt_client, transport, message_info
     ):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
 
         def trigger_early_on_publish(topic, payload, qos):
 
@@ -1755,9 +1745,9 @@ class TestPublish(object):
         "Handles multiple callbacks from multiple publish operations that complete out of order"
     )
     def test_multiple_callbacks(self, mocker, mock_mqtt_client, transport):
-        callback1 = mocker.MagicMock()
-        callback2 = mocker.MagicMock()
-        callback3 = mocker.MagicMock()
+        callback1 = mocker.Mock()
+        callback2 = mocker.Mock()
+        callback3 = mocker.Mock()
 
         mid1 = 1
         mid2 = 2
@@ -1775,31 +1765,60 @@ class TestPublish(object):
         transport.publish(topic=fake_topic, payload=fake_payload, callback=callback3)
 
         # Check callbacks have not yet been called
-        assert callback1.call_count == 0
-        assert callback2.call_count == 0
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 0, 0])
 
         # Manually trigger Paho on_publish event handler (2 -> 3 -> 1)
         mock_mqtt_client.on_publish(client=mock_mqtt_client, userdata=None, mid=mid2)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 0])
 
         mock_mqtt_client.on_publish(client=mock_mqtt_client, userdata=None, mid=mid3)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 1])
 
         mock_mqtt_client.on_publish(client=mock_mqtt_client, userdata=None, mid=mid1)
-        assert callback1.call_count == 1
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [1, 1, 1])
+
+    @pytest.mark.it(
+        "Triggers the callback of each of multiple outstanding publish operations upon completion"
+    )
+    @pytest.mark.parametrize(
+        "num_publishes",
+        [
+            pytest.param(1, id="1 publish"),
+            pytest.param(4, id="4 publishes"),
+            pytest.param(16, id="16 publishes"),
+            pytest.param(64, id="64 publishes"),
+        ],
+    )
+    def test_multiple_outstanding_publishes(
+        self, mocker, mock_mqtt_client, transport, num_publishes
+    ):
+        callbacks = [mocker.Mock() for _ in range(num_publishes)]
+        mids = list(range(1, num_publishes + 1))
+        mock_mqtt_client.publish.side_effect = [mqtt.MQTTMessageInfo(mid) for mid in mids]
+
+        # Look these up once, rather than on every iteration of the loops below
+        publish = transport.publish
+        on_publish = mock_mqtt_client.on_publish
+
+        # Initiate all publishes before any of them are completed
+        for callback in callbacks:
+            publish(topic=fake_topic, payload=fake_payload, callback=callback)
+
+        # Check callbacks have not yet been called
+        assert_call_counts(callbacks, [0] * num_publishes)
+
+        # Manually trigger Paho on_publish event handler for all the publishes
+        for mid in mids:
+            on_publish(client=mock_mqtt_client, userdata=None, mid=mid)
+
+        # Check all callbacks have now been called exactly once
+        assert_call_counts(callbacks, [1] * num_publishes)
 
     @pytest.mark.it("Recovers from Exception in callback")
     def test_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, message_info, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
         mock_mqtt_client.publish.return_value = message_info
 
         transport.publish(topic=fake_topic, payload=fake_payload, callback=callback)
@@ -1812,7 +1831,7 @@ class TestPublish(object):
     def test_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, message_info, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
         mock_mqtt_client.publish.return_value = message_info
 
         transport.publish(topic=fake_topic, payload=fake_payload, callback=callback)
@@ -1826,7 +1845,7 @@ class TestPublish(object):
     def test_callback_rasies_exception_when_paho_on_publish_triggered_early(
         self, mocker, mock_mqtt_client, transport, message_info, arbitrary_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_exception)
+        callback = mocker.Mock(side_effect=arbitrary_exception)
 
         def trigger_early_on_publish(topic, payload, qos):
             mock_mqtt_client.on_publish(
@@ -1852,7 +1871,7 @@ class TestPublish(object):
     def test_callback_rasies_base_exception_when_paho_on_publish_triggered_early(
         self, mocker, mock_mqtt_client, transport, message_info, arbitrary_base_exception
     ):
-        callback = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        callback = mocker.Mock(side_effect=arbitrary_base_exception)
 
         def trigger_early_on_publish(topic, payload, qos):
             mock_mqtt_client.on_publish(
@@ -1895,7 +1914,7 @@ class TestPublish(object):
     @pytest.mark.parametrize(
         "error_params",
         operation_return_codes,
-        ids=["{}->{}".format(x["name"], x["error"].__name__) for x in operation_return_codes],
+        ids=operation_return_code_ids,
     )
     def test_client_returns_failing_rc_code(
         self, mocker, mock_mqtt_client, transport, error_params
@@ -1918,7 +1937,7 @@ class TestMessageReceived(object):
         "Triggers on_mqtt_message_received_handler event handler upon receiving message"
     )
     def test_calls_event_handler_callback(self, mocker, mock_mqtt_client, transport, message):
-        callback = mocker.MagicMock()
+        callback = mocker.Mock()
         transport.on_mqtt_message_received_handler = callback
 
         # Manually trigger Paho on_message event_handler
@@ -1944,7 +1963,7 @@ class TestMessageReceived(object):
     def test_event_handler_callback_raises_exception(
         self, mocker, mock_mqtt_client, transport, message, arbitrary_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_exception)
         transport.on_mqtt_message_received_handler = event_cb
 
         mock_mqtt_client.on_message(client=mock_mqtt_client, userdata=None, mqtt_message=message)
@@ -1958,7 +1977,7 @@ class TestMessageReceived(object):
     def test_event_handler_callback_raises_base_exception(
         self, mocker, mock_mqtt_client, transport, message, arbitrary_base_exception
     ):
-        event_cb = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        event_cb = mocker.Mock(side_effect=arbitrary_base_exception)
         transport.on_mqtt_message_received_handler = event_cb
 
         with pytest.raises(arbitrary_base_exception.__class__) as e_info:
@@ -1974,9 +1993,9 @@ class TestMisc(object):
         "Handles multiple callbacks from multiple different types of operations that complete out of order"
     )
     def test_multiple_callbacks_multiple_ops(self, mocker, mock_mqtt_client, transport):
-        callback1 = mocker.MagicMock()
-        callback2 = mocker.MagicMock()
-        callback3 = mocker.MagicMock()
+        callback1 = mocker.Mock()
+        callback2 = mocker.Mock()
+        callback3 = mocker.Mock()
 
         mid1 = 1
         mid2 = 2
@@ -1996,27 +2015,19 @@ class TestMisc(object):
         transport.unsubscribe(topic=topic3, callback=callback3)
 
         # Check callbacks have not yet been called
-        assert callback1.call_count == 0
-        assert callback2.call_count == 0
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 0, 0])
 
         # Manually trigger Paho on_unsubscribe event handler (2 -> 3 -> 1)
         mock_mqtt_client.on_publish(client=mock_mqtt_client, userdata=None, mid=mid2)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 0
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 0])
 
         mock_mqtt_client.on_unsubscribe(client=mock_mqtt_client, userdata=None, mid=mid3)
-        assert callback1.call_count == 0
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [0, 1, 1])
 
         mock_mqtt_client.on_subscribe(
             client=mock_mqtt_client, userdata=None, mid=mid1, granted_qos=fake_qos
         )
-        assert callback1.call_count == 1
-        assert callback2.call_count == 1
-        assert callback3.call_count == 1
+        assert_call_counts([callback1, callback2, callback3], [1, 1, 1])
 
 
 @pytest.mark.describe("OperationManager")
@@ -2033,7 +2044,7 @@ class TestOperationManagerEstablishOperation(object):
     @pytest.fixture(params=[True, False])
     def optional_callback(self, mocker, request):
         if request.param:
-            return mocker.MagicMock()
+            return mocker.Mock()
         else:
             return None
 
@@ -2074,7 +2085,7 @@ class TestOperationManagerEstablishOperation(object):
     def test_early_completion_with_callback(self, mocker):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock()
+        cb_mock = mocker.Mock()
 
         # Cause early completion of an unknown operation
         manager.complete_operation(mid)
@@ -2088,7 +2099,7 @@ class TestOperationManagerEstablishOperation(object):
     def test_callback_raises_exception(self, mocker, arbitrary_exception):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock(side_effect=arbitrary_exception)
+        cb_mock = mocker.Mock(side_effect=arbitrary_exception)
 
         # Cause early completion of an unknown operation
         manager.complete_operation(mid)
@@ -2103,7 +2114,7 @@ class TestOperationManagerEstablishOperation(object):
     def test_callback_raises_base_exception(self, mocker, arbitrary_base_exception):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        cb_mock = mocker.Mock(side_effect=arbitrary_base_exception)
 
         # Cause early completion of an unknown operation
         manager.complete_operation(mid)
@@ -2117,14 +2128,14 @@ class TestOperationManagerEstablishOperation(object):
     def test_callback_called_after_lock_release(self, mocker):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock()
+        cb_mock = mocker.Mock()
 
         # Cause early completion of an unknown operation
         manager.complete_operation(mid)
 
         # Set up mock tracking
         lock_spy = mocker.spy(manager, "_lock")
-        mock_tracker = mocker.MagicMock()
+        mock_tracker = mocker.Mock()
         calls_during_lock = []
 
         # When the lock enters, start recording calls to callback
@@ -2170,7 +2181,7 @@ class TestOperationManagerCompleteOperation(object):
     def test_complete_pending_operation_callback(self, mocker):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock()
+        cb_mock = mocker.Mock()
 
         manager.establish_operation(mid, cb_mock)
         assert cb_mock.call_count == 0
@@ -2182,7 +2193,7 @@ class TestOperationManagerCompleteOperation(object):
     def test_callback_raises_exception(self, mocker, arbitrary_exception):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock(side_effect=arbitrary_exception)
+        cb_mock = mocker.Mock(side_effect=arbitrary_exception)
 
         manager.establish_operation(mid, cb_mock)
         assert cb_mock.call_count == 0
@@ -2195,7 +2206,7 @@ class TestOperationManagerCompleteOperation(object):
     def test_callback_raises_base_exception(self, mocker, arbitrary_base_exception):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock(side_effect=arbitrary_base_exception)
+        cb_mock = mocker.Mock(side_effect=arbitrary_base_exception)
 
         manager.establish_operation(mid, cb_mock)
         assert cb_mock.call_count == 0
@@ -2219,14 +2230,14 @@ class TestOperationManagerCompleteOperation(object):
     def test_callback_called_after_lock_release(self, mocker):
         manager = OperationManager()
         mid = 1
-        cb_mock = mocker.MagicMock()
+        cb_mock = mocker.Mock()
 
         # Set up an operation and save the callback
         manager.establish_operation(mid, cb_mock)
 
         # Set up mock tracking
         lock_spy = mocker.spy(manager, "_lock")
-        mock_tracker = mocker.MagicMock()
+        mock_tracker = mocker.Mock()
         calls_during_lock = []
 
         # When the lock enters, start recording calls to callback
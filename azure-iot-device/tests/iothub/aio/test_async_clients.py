@@ -4,7 +4,6 @@
 # license information.
 # --------------------------------------------------------------------------
 
-import logging
 import pytest
 import asyncio
 import threading
@@ -40,7 +39,6 @@ from ..shared_client_tests import (
 )
 
 pytestmark = pytest.mark.asyncio
-logging.basicConfig(level=logging.DEBUG)
 
 
 async def create_completed_future(result=None):
@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 import asyncio
 import inspect
@@ -17,7 +16,6 @@ from azure.iot.device.iothub.inbox_manager import InboxManager
 from azure.iot.device.iothub.aio.async_inbox import AsyncClientInbox
 
 pytestmark = pytest.mark.asyncio
-logging.basicConfig(level=logging.DEBUG)
 
 # NOTE ON TEST IMPLEMENTATION:
 # Despite having significant shared implementation between the sync and async handler managers,
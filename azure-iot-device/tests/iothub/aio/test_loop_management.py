@@ -7,11 +7,8 @@
 import pytest
 import asyncio
 import threading
-import logging
 from azure.iot.device.iothub.aio import loop_management
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 class SharedCustomLoopTests(object):
     @pytest.fixture(autouse=True)
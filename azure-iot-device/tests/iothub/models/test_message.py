@@ -5,12 +5,9 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from azure.iot.device.iothub.models import Message
 from azure.iot.device import constant
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 @pytest.mark.describe("Message")
 class TestMessage(object):
@@ -5,11 +5,8 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from azure.iot.device.iothub.models import MethodRequest, MethodResponse
 
-logging.basicConfig(level=logging.DEBUG)
-
 dummy_rid = 1
 dummy_name = "name"
 dummy_payload = {"MethodPayload": "somepayload"}
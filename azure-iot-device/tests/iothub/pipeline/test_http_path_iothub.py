@@ -4,11 +4,8 @@
 # license information.
 # --------------------------------------------------------------------------
 import pytest
-import logging
 from azure.iot.device.iothub.pipeline import http_path_iothub
 
-logging.basicConfig(level=logging.DEBUG)
-
 # NOTE: All tests are parametrized with multiple values for URL encoding. This is to show that the
 # URL encoding is done correctly - not all URL encoding encodes the '+' character. Thus we must
 # make sure any URL encoded value can encode a '+' specifically, in addition to regular encoding.
@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import six.moves.urllib as urllib
 from azure.iot.device.common import handle_exceptions
 from azure.iot.device.common.pipeline import (
@@ -21,7 +20,6 @@ from azure.iot.device.iothub.pipeline import (
 )
 from azure.iot.device.iothub.pipeline import HTTPPipeline, constant
 
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 fake_device_id = "__fake_device_id__"
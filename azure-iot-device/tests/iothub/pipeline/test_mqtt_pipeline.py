@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import six.moves.urllib as urllib
 from azure.iot.device.common import handle_exceptions
 from azure.iot.device.common.pipeline import (
@@ -24,7 +23,6 @@ from azure.iot.device.iothub import Message
 from azure.iot.device.iothub.pipeline import MQTTPipeline, constant
 from .conftest import all_features
 
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 
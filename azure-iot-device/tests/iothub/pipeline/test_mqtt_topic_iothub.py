@@ -5,13 +5,10 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import datetime
 from azure.iot.device.iothub.pipeline import mqtt_topic_iothub
 from azure.iot.device import Message
 
-logging.basicConfig(level=logging.DEBUG)
-
 # NOTE: All tests (that require it) are parametrized with multiple values for URL encoding.
 # This is to show that the URL encoding is done correctly - not all URL encoding encodes
 # the same way.
@@ -4,11 +4,9 @@
 # license information.
 # --------------------------------------------------------------------------
 import sys
-import logging
 from azure.iot.device.iothub.pipeline import pipeline_events_iothub
 from tests.common.pipeline import pipeline_event_test
 
-logging.basicConfig(level=logging.DEBUG)
 this_module = sys.modules[__name__]
 
 pipeline_event_test.add_event_test(
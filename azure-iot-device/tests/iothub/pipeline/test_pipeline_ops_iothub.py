@@ -5,11 +5,9 @@
 # --------------------------------------------------------------------------
 import pytest
 import sys
-import logging
 from azure.iot.device.iothub.pipeline import pipeline_ops_iothub
 from tests.common.pipeline import pipeline_ops_test
 
-logging.basicConfig(level=logging.DEBUG)
 this_module = sys.modules[__name__]
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
@@ -4,7 +4,6 @@
 # license information.
 # --------------------------------------------------------------------------
 import json
-import logging
 import pytest
 import sys
 from azure.iot.device.exceptions import ServiceError
@@ -20,7 +19,6 @@ from azure.iot.device.iothub.pipeline.exceptions import PipelineError
 from tests.common.pipeline.helpers import StageRunOpTestBase, StageHandlePipelineEventTestBase
 from tests.common.pipeline import pipeline_stage_test
 
-logging.basicConfig(level=logging.DEBUG)
 this_module = sys.modules[__name__]
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
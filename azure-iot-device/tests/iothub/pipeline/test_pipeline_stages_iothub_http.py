@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 import json
 import sys
@@ -21,7 +20,6 @@ from tests.common.pipeline import pipeline_stage_test
 from azure.iot.device import constant as pkg_constant
 from azure.iot.device import user_agent
 
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 this_module = sys.modules[__name__]
 
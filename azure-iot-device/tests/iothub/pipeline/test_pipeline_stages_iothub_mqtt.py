@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 import json
 import sys
@@ -30,7 +29,6 @@ from tests.common.pipeline.helpers import StageRunOpTestBase, StageHandlePipelin
 from tests.common.pipeline import pipeline_stage_test
 from azure.iot.device import constant as pkg_constant, user_agent
 
-logging.basicConfig(level=logging.DEBUG)
 this_module = sys.modules[__name__]
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread", "mock_mqtt_topic")
 
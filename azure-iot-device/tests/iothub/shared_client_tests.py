@@ -7,7 +7,6 @@
 i.e. tests for things defined in abstract clients"""
 
 import pytest
-import logging
 import os
 import io
 import six
@@ -26,9 +25,6 @@ from azure.iot.device.iothub import edge_hsm
 from azure.iot.device import ProxyOptions
 from azure.iot.device import exceptions as client_exceptions
 
-logging.basicConfig(level=logging.DEBUG)
-
-
 ################################
 # SHARED DEVICE + MODULE TESTS #
 ################################
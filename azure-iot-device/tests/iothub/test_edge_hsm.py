@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import requests
 import json
 import base64
@@ -14,9 +13,6 @@ from azure.iot.device.iothub.edge_hsm import IoTEdgeHsm, IoTEdgeError
 from azure.iot.device import user_agent
 
 
-logging.basicConfig(level=logging.DEBUG)
-
-
 @pytest.fixture
 def edge_hsm():
     return IoTEdgeHsm(
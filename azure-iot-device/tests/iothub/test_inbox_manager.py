@@ -5,16 +5,12 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import sys
 import six
 import abc
 from azure.iot.device.iothub.inbox_manager import InboxManager
 from azure.iot.device.iothub.models import Message, MethodRequest
 
-logging.basicConfig(level=logging.DEBUG)
-
-
 inbox_type_list = []
 inbox_type_ids = []
 
@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import threading
 import time
 import os
@@ -37,8 +36,6 @@ from .shared_client_tests import (
     SharedIoTHubModuleClientCreateFromEdgeEnvironmentWithDebugEnvTests,
 )
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 ##################
 # INFRASTRUCTURE #
@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-import logging
 import pytest
 import threading
 import time
@@ -13,8 +12,6 @@ from azure.iot.device.iothub.sync_handler_manager import MESSAGE, METHOD, TWIN_D
 from azure.iot.device.iothub.inbox_manager import InboxManager
 from azure.iot.device.iothub.sync_inbox import SyncClientInbox
 
-logging.basicConfig(level=logging.DEBUG)
-
 # NOTE ON TEST IMPLEMENTATION:
 # Despite having significant shared implementation between the sync and async handler managers,
 # there are not shared tests. This is because while both have the same set of requirements and
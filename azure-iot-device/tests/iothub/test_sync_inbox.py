@@ -5,13 +5,10 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import threading
 import time
 from azure.iot.device.iothub.sync_inbox import SyncClientInbox, InboxEmpty
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 @pytest.mark.describe("SyncClientInbox")
 class TestSyncClientInbox(object):
@@ -4,7 +4,6 @@
 # license information.
 # --------------------------------------------------------------------------
 import pytest
-import logging
 from azure.iot.device.provisioning.aio.async_provisioning_device_client import (
     ProvisioningDeviceClient,
 )
@@ -19,8 +18,6 @@ from ..shared_client_tests import (
     SharedProvisioningClientCreateFromX509CertificateTests,
 )
 
-
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.asyncio
 
 
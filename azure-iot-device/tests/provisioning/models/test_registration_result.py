@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 import datetime
 from azure.iot.device.provisioning.models.registration_result import (
     RegistrationResult,
@@ -13,8 +12,6 @@ from azure.iot.device.provisioning.models.registration_result import (
 )
 import json
 
-logging.basicConfig(level=logging.DEBUG)
-
 fake_request_id = "Request1234"
 fake_operation_id = "Operation4567"
 fake_status = "Flying"
@@ -5,7 +5,6 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from azure.iot.device.common.models import X509
 from azure.iot.device.provisioning.pipeline.mqtt_pipeline import MQTTPipeline
 from tests.common.pipeline import helpers
@@ -22,7 +21,6 @@ from azure.iot.device.common.pipeline import (
     pipeline_ops_base,
 )
 
-logging.basicConfig(level=logging.DEBUG)
 pytestmark = pytest.mark.usefixtures("fake_pipeline_thread")
 
 
@@ -5,11 +5,8 @@
 # --------------------------------------------------------------------------
 
 import pytest
-import logging
 from azure.iot.device.provisioning.pipeline import mqtt_topic_provisioning
 
-logging.basicConfig(level=logging.DEBUG)
-
 # NOTE: All tests (that require it) are parametrized with multiple values for URL encoding.
 # This is to show that the URL encoding is done correctly - not all URL encoding encodes
 # the same way.
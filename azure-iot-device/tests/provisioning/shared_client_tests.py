@@ -7,7 +7,6 @@
 i.e. tests for things defined in abstract clients"""
 
 import pytest
-import logging
 import socks
 
 from azure.iot.device.common import auth
@@ -16,9 +15,6 @@ from azure.iot.device.provisioning.pipeline import ProvisioningPipelineConfig
 from azure.iot.device import ProxyOptions
 from azure.iot.device.common.pipeline.config import DEFAULT_KEEPALIVE
 
-logging.basicConfig(level=logging.DEBUG)
-
-
 fake_provisioning_host = "hogwarts.com"
 fake_registration_id = "MyPensieve"
 fake_id_scope = "Enchanted0000Ceiling7898"
@@ -4,7 +4,6 @@
 # license information.
 # --------------------------------------------------------------------------
 import pytest
-import logging
 from azure.iot.device.provisioning.provisioning_device_client import ProvisioningDeviceClient
 from azure.iot.device.provisioning.pipeline import exceptions as pipeline_exceptions
 from azure.iot.device.provisioning import pipeline
@@ -17,9 +16,6 @@ from .shared_client_tests import (
 )
 
 
-logging.basicConfig(level=logging.DEBUG)
-
-
 class ProvisioningClientTestsConfig(object):
     """Defines fixtures for synchronous ProvisioningDeviceClient tests"""
 